@@ -0,0 +1,255 @@
+# app/cache.py
+
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+
+
+class CacheBackend(ABC):
+    """
+    Interface for a key/value store used by the rendered TODO list cache.
+
+    Implementations store raw bytes under string keys. An external store
+    (e.g. Redis or memcached) can be plugged in by subclassing this class
+    and passing an instance to TodoListCache.
+
+    Attributes:
+        evictions (int): The number of entries the store dropped on its own.
+    """
+
+    evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored under key, or None if it is missing.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store value under key, replacing any existing value.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove key from the store if it is present.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every entry from the store.
+        """
+
+    def stats(self) -> dict:
+        """
+        Report backend counters.
+
+        Returns:
+            dict: The eviction count, plus any backend-specific figures.
+        """
+        return {"evictions": self.evictions}
+
+    def reset_stats(self) -> None:
+        """
+        Reset backend counters without touching stored entries.
+        """
+        self.evictions = 0
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-memory least-recently-used store bounded by the total size of its values.
+
+    Attributes:
+        max_bytes (int): The byte budget for all stored values.
+        current_bytes (int): The number of bytes currently stored.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(value) > self.max_bytes:
+                # A value larger than the whole budget would evict everything
+                # and still not fit, so it is simply not cached.
+                return
+            self._entries[key] = value
+            self.current_bytes += len(value)
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["entries"] = len(self)
+        stats["bytes"] = self.current_bytes
+        stats["max_bytes"] = self.max_bytes
+        return stats
+
+    def _pop(self, key: str) -> None:
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self.current_bytes -= len(value)
+
+
+class TodoListCache:
+    """
+    Read-through cache for rendered TODO list pages, keyed by user and page.
+
+    Each user has a generation token stored in the backend and embedded in
+    their page keys. Invalidating a user replaces the token, so their old
+    pages become unreachable in every process sharing the backend and are
+    left for the backend to evict. A missing token (never set, or evicted)
+    is replaced by a fresh one, so stale pages can never be served again.
+
+    Attributes:
+        backend (CacheBackend): The store holding the rendered pages.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that had to be rendered.
+        invalidations (int): The number of calls to invalidate_user.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_generation_key(user_id: int) -> str:
+        """
+        Build the backend key holding a user's generation token.
+
+        Args:
+            user_id (int): The ID of the user owning the TODO items.
+
+        Returns:
+            str: The backend key.
+        """
+        return f"todos:{user_id}:gen"
+
+    def make_key(self, user_id: int, page: int) -> str:
+        """
+        Build the backend key for the current generation of a user's page.
+
+        Args:
+            user_id (int): The ID of the user owning the TODO items.
+            page (int): The 1-based page number.
+
+        Returns:
+            str: The backend key.
+        """
+        gen_key = self.make_generation_key(user_id)
+        generation = self.backend.get(gen_key)
+        if generation is None:
+            generation = uuid.uuid4().hex.encode("ascii")
+            self.backend.set(gen_key, generation)
+        return f"todos:{user_id}:{generation.decode('ascii')}:{page}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a rendered page and record a hit or a miss.
+
+        Args:
+            key (str): The page key returned by make_key.
+
+        Returns:
+            Optional[bytes]: The rendered page, or None if it is not cached.
+        """
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a rendered page.
+
+        The key must be the one taken before the page was queried, so that a
+        page rendered while the user was being invalidated is stored under
+        the old generation and never served.
+
+        Args:
+            key (str): The page key returned by make_key.
+            value (bytes): The rendered page.
+        """
+        self.backend.set(key, value)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Make every cached page belonging to a user unreachable.
+
+        Args:
+            user_id (int): The ID of the user whose TODO items changed.
+        """
+        self.backend.delete(self.make_generation_key(user_id))
+        with self._lock:
+            self.invalidations += 1
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hit, miss, invalidation and eviction counters.
+
+        Cached pages are left in place; the backend may be shared with other
+        data, so it is never flushed from here.
+        """
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+        self.backend.reset_stats()
+
+    def stats(self) -> dict:
+        """
+        Report the cache counters.
+
+        Returns:
+            dict: Hit, miss and invalidation counts merged with the backend's stats.
+        """
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+        stats.update(self.backend.stats())
+        return stats
+
+
+# Shared cache used by the views and invalidated by crud mutations
+todo_cache = TodoListCache(LRUCacheBackend(max_bytes=settings.TODO_CACHE_MAX_BYTES))
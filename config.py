@@ -7,5 +7,7 @@ class Settings:
     SECRET_KEY: str = "your-secret-key"  # Replace with your actual secret key
     ALGORITHM: str = "HS256"  # The algorithm used for JWT encoding
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # Token expiration time in minutes
+    TODO_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # Byte budget for cached TODO list pages
+    TODOS_PER_PAGE: int = 10  # Number of TODO items shown per page
 
 settings = Settings()
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app import models, schemas
+from app.cache import todo_cache
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -24,7 +25,7 @@ def authenticate_user(db: Session, username: str, password: str):
     return user
 
 def get_todo_items(db: Session, user_id: int, skip: int = 0, limit: int = 10):
-    return db.query(models.TodoItem).filter(models.TodoItem.owner_id == user_id).offset(skip).limit(limit).all()
+    return db.query(models.TodoItem).filter(models.TodoItem.owner_id == user_id).order_by(models.TodoItem.id).offset(skip).limit(limit).all()
 
 def get_todo_item(db: Session, todo_id: int, user_id: int):
     return db.query(models.TodoItem).filter(models.TodoItem.id == todo_id, models.TodoItem.owner_id == user_id).first()
@@ -34,6 +35,7 @@ def create_todo_item(db: Session, todo: schemas.TodoItemCreate, user_id: int):
     db.add(db_todo)
     db.commit()
     db.refresh(db_todo)
+    todo_cache.invalidate_user(user_id)
     return db_todo
 
 def update_todo_item(db: Session, todo_id: int, todo: schemas.TodoItemCreate, user_id: int):
@@ -42,10 +44,12 @@ def update_todo_item(db: Session, todo_id: int, todo: schemas.TodoItemCreate, us
     db_todo.description = todo.description
     db.commit()
     db.refresh(db_todo)
+    todo_cache.invalidate_user(user_id)
     return db_todo
 
 def delete_todo_item(db: Session, todo_id: int, user_id: int):
     db_todo = db.query(models.TodoItem).filter(models.TodoItem.id == todo_id, models.TodoItem.owner_id == user_id).first()
     db.delete(db_todo)
     db.commit()
+    todo_cache.invalidate_user(user_id)
     return db_todo
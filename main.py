@@ -1,10 +1,12 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Request, Form
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Form, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from fastapi.templating import Jinja2Templates
 from app import models, schemas, crud, auth
 from .database import SessionLocal, engine
+from .cache import todo_cache
+from .config import settings
 from datetime import timedelta
 from fastapi.staticfiles import StaticFiles
 
@@ -31,6 +33,29 @@ def get_db():
     finally:
         db.close()
 
+def render_todos(request: Request, db: Session, current_user: models.User, page: int = 1) -> HTMLResponse:
+    """
+    Render a page of the user's TODO items, serving it from the cache when possible.
+    """
+    cache_key = todo_cache.make_key(current_user.id, page)
+    body = todo_cache.get(cache_key)
+    if body is None:
+        todos = crud.get_todo_items(
+            db,
+            user_id=current_user.id,
+            skip=(page - 1) * settings.TODOS_PER_PAGE,
+            limit=settings.TODOS_PER_PAGE,
+        )
+        html = templates.get_template("todo.html").render(
+            {"request": request, "todos": todos, "user": current_user}
+        )
+        body = html.encode("utf-8")
+        # Pages past the last one are not cached, so arbitrary page numbers
+        # cannot fill the cache with empty lists
+        if todos or page == 1:
+            todo_cache.set(cache_key, body)
+    return HTMLResponse(content=body)
+
 @app.post("/token", response_model=schemas.Token)
 async def login_for_access_token(
     db: Session = Depends(get_db),
@@ -102,16 +127,19 @@ async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/todos/", response_class=HTMLResponse)
-async def read_todos(request: Request, db: Session = Depends(get_db)):
+async def read_todos(
+    request: Request,
+    page: int = Query(1, ge=1),
+    db: Session = Depends(get_db)
+):
     """
-    Retrieve and display all TODO items for the current user.
+    Display one page of TODOS_PER_PAGE items for the current user, selected by ?page=.
     """
     token = request.cookies.get("access_token")
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     current_user = await auth.get_current_user(db, token)
-    todos = crud.get_todo_items(db, user_id=current_user.id)
-    return templates.TemplateResponse("todo.html", {"request": request, "todos": todos, "user": current_user})
+    return render_todos(request, db, current_user, page)
 
 @app.post("/todos/create", response_class=HTMLResponse)
 async def create_todo(
@@ -129,8 +157,7 @@ async def create_todo(
     current_user = await auth.get_current_user(db, token)
     todo = schemas.TodoItemCreate(title=title, description=description)
     crud.create_todo_item(db=db, todo=todo, user_id=current_user.id)
-    todos = crud.get_todo_items(db, user_id=current_user.id)
-    return templates.TemplateResponse("todo.html", {"request": request, "todos": todos, "user": current_user})
+    return render_todos(request, db, current_user)
 
 @app.post("/todos/{todo_id}/update", response_class=HTMLResponse)
 async def update_todo(
@@ -150,8 +177,7 @@ async def update_todo(
     current_user = await auth.get_current_user(db, token)
     todo = schemas.TodoItemCreate(title=title, description=description)
     crud.update_todo_item(db=db, todo_id=todo_id, todo=todo, user_id=current_user.id)
-    todos = crud.get_todo_items(db, user_id=current_user.id)
-    return templates.TemplateResponse("todo.html", {"request": request, "todos": todos, "user": current_user})
+    return render_todos(request, db, current_user)
 
 @app.post("/todos/{todo_id}/delete", response_class=HTMLResponse)
 async def delete_todo(
@@ -167,8 +193,7 @@ async def delete_todo(
         raise HTTPException(status_code=401, detail="Not authenticated")
     current_user = await auth.get_current_user(db, token)
     crud.delete_todo_item(db=db, todo_id=todo_id, user_id=current_user.id)
-    todos = crud.get_todo_items(db, user_id=current_user.id)
-    return templates.TemplateResponse("todo.html", {"request": request, "todos": todos, "user": current_user})
+    return render_todos(request, db, current_user)
 
 @app.get("/login", response_class=HTMLResponse)
 async def login(request: Request):
@@ -195,6 +220,17 @@ async def read_users_me(request: Request, db: Session = Depends(get_db)):
     current_user = await auth.get_current_user(db, token)
     return current_user
 
+@app.get("/cache/stats")
+async def read_cache_stats(request: Request, db: Session = Depends(get_db)):
+    """
+    Report hit, miss and eviction counters for the TODO list cache.
+    """
+    token = request.cookies.get("access_token")
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    await auth.get_current_user(db, token)
+    return todo_cache.stats()
+
 @app.post("/logout")
 async def logout(request: Request):
     """
@@ -1,8 +1,10 @@
+import re
 import pytest
 from httpx import AsyncClient
 from fastapi import FastAPI
 from app.main import app  # Adjust the import based on your project structure
 from app.database import SessionLocal, engine, Base
+from app.cache import todo_cache, LRUCacheBackend, TodoListCache
 from sqlalchemy.orm import Session
 from fastapi.testclient import TestClient
 
@@ -95,3 +97,135 @@ def test_delete_todo(test_db: Session):
     assert response.status_code == 200
     assert "Todo to Delete" not in response.text
 
+
+def login_as(username: str) -> str:
+    client.post("/register", data={"username": username, "password": "testpassword"})
+    response = client.post("/login", data={"username": username, "password": "testpassword"})
+    return response.cookies["access_token"]
+
+def test_cache_stats_requires_authentication():
+    response = client.get("/cache/stats")
+    assert response.status_code == 401
+
+def test_todo_list_cache(test_db: Session):
+    todo_cache.reset_stats()
+    token = login_as("cacheuser")
+    other_token = login_as("othercacheuser")
+
+    # The second read is served from the cache
+    client.get("/todos/", cookies={"access_token": token})
+    client.get("/todos/", cookies={"access_token": other_token})
+    client.get("/todos/", cookies={"access_token": token})
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+
+    # Creating a todo item invalidates only its owner's cached page
+    response = client.post(
+        "/todos/create",
+        data={"title": "Cached Todo", "description": "Description"},
+        cookies={"access_token": token}
+    )
+    assert "Cached Todo" in response.text
+    todo_id = re.search(r'action="/todos/(\d+)/update"', response.text).group(1)
+    response = client.get("/todos/", cookies={"access_token": other_token})
+    assert "Cached Todo" not in response.text
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["invalidations"] == 1
+    assert stats["misses"] == 3
+    assert stats["hits"] == 2
+
+    response = client.get("/todos/", cookies={"access_token": token})
+    assert "Cached Todo" in response.text
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["hits"] == 3
+
+    # Updating a todo item refreshes its owner's cached page
+    client.post(
+        f"/todos/{todo_id}/update",
+        data={"title": "Updated Cached Todo", "description": "Description"},
+        cookies={"access_token": token}
+    )
+    response = client.get("/todos/", cookies={"access_token": token})
+    assert "Updated Cached Todo" in response.text
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["invalidations"] == 2
+    assert stats["misses"] == 4
+    assert stats["hits"] == 4
+
+    # Deleting a todo item refreshes its owner's cached page
+    client.post(f"/todos/{todo_id}/delete", cookies={"access_token": token})
+    response = client.get("/todos/", cookies={"access_token": token})
+    assert "Cached Todo" not in response.text
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["invalidations"] == 3
+    assert stats["misses"] == 5
+    assert stats["hits"] == 5
+
+    # The other user's page survived every mutation and is still a hit
+    client.get("/todos/", cookies={"access_token": other_token})
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["misses"] == 5
+    assert stats["hits"] == 6
+
+def test_cached_todo_list_does_not_depend_on_origin(test_db: Session):
+    token = login_as("originuser")
+    other_client = TestClient(app, base_url="https://127.0.0.1")
+
+    # The first origin fills the cache and the second one is served from it
+    first = client.get("/todos/", cookies={"access_token": token})
+    second = other_client.get("/todos/", cookies={"access_token": token})
+    for response in (first, second):
+        assert 'href="/static/style.css"' in response.text
+        assert "testserver" not in response.text
+        assert "127.0.0.1" not in response.text
+
+def test_todo_list_pagination(test_db: Session):
+    todo_cache.reset_stats()
+    token = login_as("pageuser")
+    for i in range(1, 12):
+        client.post(
+            "/todos/create",
+            data={"title": f"Paged Todo {i:02d}", "description": "Description"},
+            cookies={"access_token": token}
+        )
+    todo_cache.reset_stats()
+
+    response = client.get("/todos/?page=2", cookies={"access_token": token})
+    assert "Paged Todo 11" in response.text
+    assert "Paged Todo 01" not in response.text
+    response = client.get("/todos/?page=2", cookies={"access_token": token})
+    assert "Paged Todo 11" in response.text
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["hits"] == 1
+
+    # Pages past the last one are rendered but never cached
+    client.get("/todos/?page=3", cookies={"access_token": token})
+    client.get("/todos/?page=3", cookies={"access_token": token})
+    stats = client.get("/cache/stats", cookies={"access_token": token}).json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+    response = client.get("/todos/?page=0", cookies={"access_token": token})
+    assert response.status_code == 422
+
+def test_invalidation_is_shared_through_backend():
+    # Two caches over one backend stand in for two worker processes
+    backend = LRUCacheBackend(max_bytes=1024)
+    first, second = TodoListCache(backend), TodoListCache(backend)
+    first.set(first.make_key(1, 1), b"user 1")
+    first.set(first.make_key(2, 1), b"user 2")
+    second.invalidate_user(1)
+    assert first.get(first.make_key(1, 1)) is None
+    assert first.get(first.make_key(2, 1)) == b"user 2"
+
+def test_lru_cache_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_bytes=10)
+    backend.set("a", b"aaaa")
+    backend.set("b", b"bbbb")
+    backend.get("a")
+    backend.set("c", b"cccc")
+    assert backend.get("a") == b"aaaa"
+    assert backend.get("b") is None
+    assert backend.evictions == 1
+    assert backend.current_bytes == 8